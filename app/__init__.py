@@ -1,6 +1,9 @@
 import os
 
-from flask import Flask
+import click
+from flask import Flask, current_app, g, has_request_context, request
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import event
 
 from .config import Config
 from .extensions import bcrypt, db, login_manager
@@ -11,10 +14,17 @@ def create_app():
     app = Flask(__name__)
     app.config.from_object(Config)
 
+    cache_dir = app.config.get("JINJA_BYTECODE_CACHE_DIR")
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+
     db.init_app(app)
     login_manager.init_app(app)
     bcrypt.init_app(app)
 
+    _install_query_counter(app)
+
     from .auth.routes import auth_bp
     from .admin.routes import admin_bp
     from .judge.routes import judge_bp
@@ -25,17 +35,46 @@ def create_app():
     app.register_blueprint(admin_bp, url_prefix="/admin")
     app.register_blueprint(judge_bp, url_prefix="/judge")
 
-    with app.app_context():
+    if not app.debug:
+        # Compile every template up front instead of on each worker's first hit.
+        for template_name in app.jinja_env.list_templates():
+            app.jinja_env.get_template(template_name)
+
+    @app.cli.command("init-db")
+    def init_db_command():
+        """Create tables and seed default data."""
         db.create_all()
         _seed_competitions()
         _seed_primary_admin()
         _seed_active_event()
+        click.echo("Database initialized.")
 
     return app
 
 
+def _install_query_counter(app):
+    # Installed unconditionally because `app.run(debug=True)` turns debug on after
+    # create_app returns; both hooks check the flag per request instead.
+    with app.app_context():
+        engine = db.engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_query(conn, cursor, statement, parameters, context, executemany):
+        if has_request_context() and current_app.debug:
+            g.query_count = g.get("query_count", 0) + 1
+
+    # Teardown runs after a streamed body finishes, so queries issued while
+    # rendering a streamed template are counted too.
+    @app.teardown_request
+    def log_query_count(exc):
+        if current_app.debug:
+            app.logger.debug(
+                "%s %s ran %d queries", request.method, request.path, g.get("query_count", 0)
+            )
+
+
 def _seed_competitions():
-    if Competition.query.count() > 0:
+    if db.session.scalar(db.select(db.func.count()).select_from(Competition)):
         return
 
     competitions = [
@@ -46,14 +85,15 @@ def _seed_competitions():
         ("Folkdance", "folkdance"),
     ]
 
-    for name, slug in competitions:
-        db.session.add(Competition(name=name, slug=slug))
-
+    db.session.execute(
+        db.insert(Competition),
+        [{"name": name, "slug": slug} for name, slug in competitions],
+    )
     db.session.commit()
 
 
 def _seed_primary_admin():
-    if User.query.count() > 0:
+    if db.session.scalar(db.select(db.func.count()).select_from(User)):
         return
 
     default_username = os.getenv("DEFAULT_ADMIN_USERNAME", "admin")
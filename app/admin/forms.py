@@ -1,61 +1,78 @@
 from flask_wtf import FlaskForm
-from wtforms import FloatField, PasswordField, SelectField, StringField, SubmitField
+from wtforms import (
+    FloatField,
+    PasswordField,
+    SelectField,
+    StringField,
+    SubmitField,
+    TextAreaField,
+)
 from wtforms.validators import DataRequired, EqualTo, Length, NumberRange
 
 
+_REQUIRED = DataRequired()
+_MIN_PASSWORD = Length(min=8)
+_POSITIVE = NumberRange(min=0.1)
+
+
 class CompetitionForm(FlaskForm):
-    name = StringField("Competition Name", validators=[DataRequired()])
-    slug = StringField("Slug", validators=[DataRequired()])
+    name = StringField("Competition Name", validators=[_REQUIRED])
+    slug = StringField("Slug", validators=[_REQUIRED])
     submit = SubmitField("Add Competition")
 
 
 class JudgeForm(FlaskForm):
-    name = StringField("Judge Full Name", validators=[DataRequired()])
-    username = StringField("Judge Username", validators=[DataRequired()])
+    name = StringField("Judge Full Name", validators=[_REQUIRED])
+    username = StringField("Judge Username", validators=[_REQUIRED])
     password = PasswordField(
         "Judge Password",
-        validators=[DataRequired(), Length(min=8)],
+        validators=[_REQUIRED, _MIN_PASSWORD],
     )
     competition_id = SelectField("Competition", coerce=int)
     submit = SubmitField("Add Judge")
 
 
 class JudgeAssignForm(FlaskForm):
-    judge_id = SelectField("Existing Judge", coerce=int, validators=[DataRequired()])
+    judge_id = SelectField("Existing Judge", coerce=int, validators=[_REQUIRED])
     submit = SubmitField("Assign Judge")
 
 
 class ContestantForm(FlaskForm):
-    name = StringField("Contestant Name", validators=[DataRequired()])
+    name = StringField("Contestant Name", validators=[_REQUIRED])
     competition_id = SelectField("Competition", coerce=int)
     submit = SubmitField("Add Contestant")
 
 
+class ContestantBulkForm(FlaskForm):
+    names = TextAreaField("Contestant Names (one per line)", validators=[_REQUIRED])
+    submit = SubmitField("Add Contestants")
+
+
 class CriteriaForm(FlaskForm):
-    name = StringField("Criteria Name", validators=[DataRequired()])
-    max_score = FloatField("Max Score", validators=[DataRequired(), NumberRange(min=0.1)])
-    weight = FloatField("Weight (%)", validators=[DataRequired(), NumberRange(min=0.1)])
+    name = StringField("Criteria Name", validators=[_REQUIRED])
+    max_score = FloatField("Max Score", validators=[_REQUIRED, _POSITIVE])
+    weight = FloatField("Weight (%)", validators=[_REQUIRED, _POSITIVE])
     competition_id = SelectField("Competition", coerce=int)
     submit = SubmitField("Add Criteria")
 
 
 class AccountForm(FlaskForm):
-    username = StringField("Username", validators=[DataRequired()])
-    password = PasswordField("Password", validators=[DataRequired()])
+    username = StringField("Username", validators=[_REQUIRED])
+    password = PasswordField("Password", validators=[_REQUIRED])
     role = SelectField("Role", choices=[("admin", "Admin")])
     submit = SubmitField("Create Account")
 
 
 class ChangePasswordForm(FlaskForm):
-    current_password = PasswordField("Current Password", validators=[DataRequired()])
+    current_password = PasswordField("Current Password", validators=[_REQUIRED])
     new_password = PasswordField(
         "New Password",
-        validators=[DataRequired(), Length(min=8)],
+        validators=[_REQUIRED, _MIN_PASSWORD],
     )
     confirm_password = PasswordField(
         "Confirm New Password",
         validators=[
-            DataRequired(),
+            _REQUIRED,
             EqualTo("new_password", message="Passwords must match."),
         ],
     )
@@ -63,10 +80,10 @@ class ChangePasswordForm(FlaskForm):
 
 
 class ResetDatabaseForm(FlaskForm):
-    password = PasswordField("Confirm Password", validators=[DataRequired()])
+    password = PasswordField("Confirm Password", validators=[_REQUIRED])
     reset_submit = SubmitField("Reset Database")
 
 
 class EventTitleForm(FlaskForm):
-    name = StringField("Event Title", validators=[DataRequired(), Length(max=120)])
+    name = StringField("Event Title", validators=[_REQUIRED, Length(max=120)])
     submit = SubmitField("Update Event")
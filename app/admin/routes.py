@@ -1,8 +1,22 @@
 from datetime import datetime
-
-from sqlalchemy import func
-
-from flask import Response, flash, redirect, render_template, request, url_for
+from functools import lru_cache
+from operator import itemgetter
+
+from sqlalchemy import func, literal, union
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
+
+from flask import (
+    Response,
+    abort,
+    flash,
+    get_flashed_messages,
+    redirect,
+    render_template,
+    request,
+    stream_template,
+    url_for,
+)
 from flask_login import current_user, login_required
 
 from . import admin_bp
@@ -10,6 +24,7 @@ from .forms import (
     AccountForm,
     ChangePasswordForm,
     CompetitionForm,
+    ContestantBulkForm,
     ContestantForm,
     CriteriaForm,
     EventTitleForm,
@@ -17,7 +32,7 @@ from .forms import (
     JudgeAssignForm,
     ResetDatabaseForm,
 )
-from ..extensions import db
+from ..extensions import db, strict_loading
 from ..models import (
     Competition,
     Contestant,
@@ -28,45 +43,76 @@ from ..models import (
     User,
     judge_competitions,
 )
+from ..utils.competitions import competitions_ordered
 from ..utils.decorators import role_required
+from ..utils.events import clear_active_event_cache, get_active_event
 from ..utils.pdf import render_results_pdf
+from ..utils.text import slugify
 
 
-def _get_active_event():
-    event = Event.query.filter_by(status="active").first()
-    if event:
-        return event
-    event = Event(name="Main Event", status="active")
-    db.session.add(event)
-    db.session.commit()
-    return event
+PAGE_SIZE = 100
 
 
-def _competition_judges_query(competition_id):
-    return (
-        Judge.query.outerjoin(
-            judge_competitions,
-            Judge.id == judge_competitions.c.judge_id,
-        )
-        .filter(
-            (Judge.competition_id == competition_id)
-            | (judge_competitions.c.competition_id == competition_id)
+def _stream_page(template_name, **context):
+    # Pop flashes before streaming so the session change is saved with the headers.
+    get_flashed_messages()
+    return stream_template(template_name, **context)
+
+
+def _find_competition(competitions_list, competition_id):
+    if not competition_id:
+        return None
+    for competition in competitions_list:
+        if competition.id == competition_id:
+            return competition
+    return db.session.get(Competition, competition_id)
+
+
+def _load_competition(competition_id):
+    return db.session.execute(
+        db.select(Competition)
+        .options(
+            selectinload(Competition.contestants),
+            selectinload(Competition.criteria),
+            *strict_loading(),
         )
-        .distinct()
-        .order_by(Judge.name)
+        .filter_by(id=competition_id)
+    ).scalar_one_or_none()
+
+
+def _count_query(model, *criteria):
+    return db.select(func.count()).select_from(model).where(*criteria)
+
+
+def _competition_judges_query(competition_id):
+    judge_ids = union(
+        db.select(Judge.id).where(Judge.competition_id == competition_id),
+        db.select(judge_competitions.c.judge_id).where(
+            judge_competitions.c.competition_id == competition_id
+        ),
     )
+    return Judge.query.filter(Judge.id.in_(judge_ids)).order_by(Judge.name)
 
 @admin_bp.route("/")
 @login_required
 @role_required("admin")
 def dashboard():
-    active_event = _get_active_event()
+    active_event = get_active_event()
+    counts = db.session.execute(
+        db.select(
+            _count_query(Competition).scalar_subquery(),
+            _count_query(Judge).scalar_subquery(),
+            _count_query(Contestant).scalar_subquery(),
+            _count_query(Criteria).scalar_subquery(),
+            _count_query(User, User.role == "judge").scalar_subquery(),
+        )
+    ).one()
     stats = {
-        "competitions": Competition.query.count(),
-        "judges": Judge.query.count(),
-        "contestants": Contestant.query.count(),
-        "criteria": Criteria.query.count(),
-        "judge_accounts": User.query.filter_by(role="judge").count(),
+        "competitions": counts[0],
+        "judges": counts[1],
+        "contestants": counts[2],
+        "criteria": counts[3],
+        "judge_accounts": counts[4],
     }
     return render_template("admin/dashboard.html", stats=stats, active_event=active_event)
 
@@ -77,35 +123,57 @@ def dashboard():
 def competitions():
     form = CompetitionForm()
     if form.validate_on_submit():
-        slug = form.slug.data.strip().lower().replace(" ", "-")
-        if Competition.query.filter_by(slug=slug).first():
+        slug = slugify(form.slug.data)
+        db.session.add(Competition(name=form.name.data.strip(), slug=slug))
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
             flash("Slug already exists.", "warning")
         else:
-            db.session.add(Competition(name=form.name.data.strip(), slug=slug))
-            db.session.commit()
             flash("Competition added.", "success")
         return redirect(url_for("admin.competitions"))
 
-    competitions_list = Competition.query.order_by(Competition.name).all()
-    active_event = _get_active_event()
+    competitions_list = competitions_ordered()
+    active_event = get_active_event()
+    judge_links = union(
+        db.select(Judge.id, Judge.competition_id),
+        db.select(judge_competitions.c.judge_id, judge_competitions.c.competition_id),
+    ).subquery()
+    judge_counts = dict(
+        db.session.query(judge_links.c.competition_id, func.count())
+        .group_by(judge_links.c.competition_id)
+        .all()
+    )
+    contestant_counts = dict(
+        db.session.query(Contestant.competition_id, func.count(Contestant.id))
+        .group_by(Contestant.competition_id)
+        .all()
+    )
+    criteria_counts = dict(
+        db.session.query(Criteria.competition_id, func.count(Criteria.id))
+        .group_by(Criteria.competition_id)
+        .all()
+    )
+    score_counts = dict(
+        db.session.query(Score.competition_id, func.count(Score.id))
+        .filter(Score.event_id == active_event.id)
+        .group_by(Score.competition_id)
+        .all()
+    )
+
     competition_status = {}
     for competition in competitions_list:
-        judge_count = _competition_judges_query(competition.id).count()
-        contestant_count = Contestant.query.filter_by(competition_id=competition.id).count()
-        criteria_count = Criteria.query.filter_by(competition_id=competition.id).count()
-        expected_scores = judge_count * contestant_count * criteria_count
+        expected_scores = (
+            judge_counts.get(competition.id, 0)
+            * contestant_counts.get(competition.id, 0)
+            * criteria_counts.get(competition.id, 0)
+        )
         if expected_scores == 0:
             competition_status[competition.id] = False
             continue
 
-        score_count = (
-            Score.query.filter_by(
-                event_id=active_event.id,
-                competition_id=competition.id,
-            )
-            .with_entities(func.count(Score.id))
-            .scalar()
-        )
+        score_count = score_counts.get(competition.id, 0)
         competition_status[competition.id] = score_count >= expected_scores
 
     return render_template(
@@ -120,8 +188,14 @@ def competitions():
 @login_required
 @role_required("admin")
 def delete_competition(competition_id):
-    competition = Competition.query.get_or_404(competition_id)
-    db.session.delete(competition)
+    competition = db.get_or_404(Competition, competition_id)
+    Score.query.filter_by(competition_id=competition.id).delete(synchronize_session=False)
+    db.session.execute(
+        judge_competitions.delete().where(judge_competitions.c.competition_id == competition.id)
+    )
+    Criteria.query.filter_by(competition_id=competition.id).delete(synchronize_session=False)
+    Contestant.query.filter_by(competition_id=competition.id).delete(synchronize_session=False)
+    Competition.query.filter_by(id=competition.id).delete(synchronize_session=False)
     db.session.commit()
     flash("Competition deleted.", "success")
     return redirect(url_for("admin.competitions"))
@@ -131,7 +205,7 @@ def delete_competition(competition_id):
 @login_required
 @role_required("admin")
 def judges():
-    competitions_list = Competition.query.order_by(Competition.name).all()
+    competitions_list = competitions_ordered()
     return render_template(
         "admin/judges.html",
         competitions=competitions_list,
@@ -142,13 +216,19 @@ def judges():
 @login_required
 @role_required("admin")
 def manage_judges(competition_id):
-    competition = Competition.query.get_or_404(competition_id)
+    competition = db.get_or_404(Competition, competition_id)
     judge_form = JudgeForm(prefix="new")
     assign_form = JudgeAssignForm(prefix="assign")
     judge_form.competition_id.choices = [(competition.id, competition.name)]
     judge_form.competition_id.data = competition.id
 
-    assigned_judges = _competition_judges_query(competition.id).all()
+    assigned_rows = (
+        _competition_judges_query(competition.id)
+        .outerjoin(User, (User.judge_id == Judge.id) & (User.role == "judge"))
+        .add_columns(User.username)
+        .all()
+    )
+    assigned_judges = [judge for judge, _ in assigned_rows]
     assigned_judge_ids = {judge.id for judge in assigned_judges}
     available_judges = Judge.query.order_by(Judge.name).all()
     assign_form.judge_id.choices = [
@@ -159,10 +239,6 @@ def manage_judges(competition_id):
 
     if "new-submit" in request.form and judge_form.validate_on_submit():
         username = judge_form.username.data.strip()
-        if User.query.filter_by(username=username).first():
-            flash("Username already exists.", "warning")
-            return redirect(url_for("admin.manage_judges", competition_id=competition.id))
-
         judge = Judge(name=judge_form.name.data.strip(), competition_id=competition.id)
         db.session.add(judge)
         db.session.flush()
@@ -178,12 +254,18 @@ def manage_judges(competition_id):
         )
         user.set_password(judge_form.password.data)
         db.session.add(user)
-        db.session.commit()
-        flash("Judge account created.", "success")
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # The judge row goes away with the rollback too.
+            db.session.rollback()
+            flash("Username already exists.", "warning")
+        else:
+            flash("Judge account created.", "success")
         return redirect(url_for("admin.manage_judges", competition_id=competition.id))
 
     if "assign-submit" in request.form and assign_form.validate_on_submit():
-        judge = Judge.query.get_or_404(assign_form.judge_id.data)
+        judge = db.get_or_404(Judge, assign_form.judge_id.data)
         if judge.id in assigned_judge_ids:
             flash("Judge already assigned to this competition.", "warning")
             return redirect(url_for("admin.manage_judges", competition_id=competition.id))
@@ -192,15 +274,7 @@ def manage_judges(competition_id):
         flash("Judge assigned to competition.", "success")
         return redirect(url_for("admin.manage_judges", competition_id=competition.id))
 
-    judge_users = {}
-    if assigned_judge_ids:
-        judge_users = {
-            user.judge_id: user
-            for user in User.query.filter_by(role="judge")
-            .filter(User.judge_id.in_(assigned_judge_ids))
-            .all()
-            if user.judge_id
-        }
+    judge_users = {judge.id: username for judge, username in assigned_rows if username}
     return render_template(
         "admin/judges_manage.html",
         form=judge_form,
@@ -215,7 +289,7 @@ def manage_judges(competition_id):
 @login_required
 @role_required("admin")
 def delete_judge(judge_id):
-    judge = Judge.query.get_or_404(judge_id)
+    judge = db.get_or_404(Judge, judge_id)
     competition_id = request.form.get("competition_id", type=int)
     assigned_competitions = {competition.id for competition in judge.competitions}
     if judge.competition_id:
@@ -256,7 +330,7 @@ def delete_judge(judge_id):
 @login_required
 @role_required("admin")
 def contestants():
-    competitions_list = Competition.query.order_by(Competition.name).all()
+    competitions_list = competitions_ordered()
     return render_template(
         "admin/contestants.html",
         competitions=competitions_list,
@@ -267,10 +341,25 @@ def contestants():
 @login_required
 @role_required("admin")
 def manage_contestants(competition_id):
-    competition = Competition.query.get_or_404(competition_id)
+    competition = db.get_or_404(Competition, competition_id)
     form = ContestantForm()
     form.competition_id.choices = [(competition.id, competition.name)]
     form.competition_id.data = competition.id
+    bulk_form = ContestantBulkForm(prefix="bulk")
+
+    if "bulk-submit" in request.form and bulk_form.validate_on_submit():
+        # DataRequired already rejects blank and whitespace-only input.
+        names = [name.strip() for name in bulk_form.names.data.splitlines() if name.strip()]
+        db.session.execute(
+            db.insert(Contestant),
+            [{"name": name, "competition_id": competition.id} for name in names],
+        )
+        db.session.commit()
+        noun = "contestant" if len(names) == 1 else "contestants"
+        flash(f"{len(names)} {noun} added.", "success")
+        return redirect(
+            url_for("admin.manage_contestants", competition_id=competition.id)
+        )
 
     if form.validate_on_submit():
         db.session.add(
@@ -284,16 +373,34 @@ def manage_contestants(competition_id):
             url_for("admin.manage_contestants", competition_id=competition.id)
         )
 
+    after_name = request.args.get("after_name")
+    after_id = request.args.get("after_id", type=int)
+    contestants_query = Contestant.query.filter_by(competition_id=competition.id)
+    if after_name is not None and after_id is not None:
+        contestants_query = contestants_query.filter(
+            (Contestant.name > after_name)
+            | ((Contestant.name == after_name) & (Contestant.id > after_id))
+        )
     contestants_list = (
-        Contestant.query.filter_by(competition_id=competition.id)
-        .order_by(Contestant.name)
+        contestants_query.order_by(Contestant.name, Contestant.id)
+        .options(*strict_loading())
+        .limit(PAGE_SIZE + 1)
         .all()
     )
+    next_page = None
+    if len(contestants_list) > PAGE_SIZE:
+        contestants_list = contestants_list[:PAGE_SIZE]
+        next_page = {
+            "after_name": contestants_list[-1].name,
+            "after_id": contestants_list[-1].id,
+        }
     return render_template(
         "admin/contestants_manage.html",
         form=form,
+        bulk_form=bulk_form,
         competition=competition,
         contestants=contestants_list,
+        next_page=next_page,
     )
 
 
@@ -301,7 +408,7 @@ def manage_contestants(competition_id):
 @login_required
 @role_required("admin")
 def delete_contestant(contestant_id):
-    contestant = Contestant.query.get_or_404(contestant_id)
+    contestant = db.get_or_404(Contestant, contestant_id)
     db.session.delete(contestant)
     db.session.commit()
     flash("Contestant deleted.", "success")
@@ -313,49 +420,54 @@ def delete_contestant(contestant_id):
 @role_required("admin")
 def criteria():
     form = CriteriaForm()
-    competitions_list = Competition.query.order_by(Competition.name).all()
+    competitions_list = competitions_ordered()
     competition_id = request.args.get("competition_id", type=int)
     if not competition_id and competitions_list:
         competition_id = competitions_list[0].id
 
-    competition = Competition.query.get(competition_id) if competition_id else None
+    if request.method == "POST":
+        # Writes must not attach criteria to a competition that no longer exists.
+        competition = db.session.get(Competition, competition_id) if competition_id else None
+    else:
+        competition = _find_competition(competitions_list, competition_id)
     if competition:
         form.competition_id.choices = [(competition.id, competition.name)]
         form.competition_id.data = competition.id
 
     if form.validate_on_submit():
         existing_total = (
-            db.session.query(db.func.coalesce(db.func.sum(Criteria.weight), 0.0))
-            .filter(Criteria.competition_id == form.competition_id.data)
-            .scalar()
+            db.select(db.func.coalesce(db.func.sum(Criteria.weight), 0.0))
+            .where(Criteria.competition_id == form.competition_id.data)
+            .scalar_subquery()
         )
-        if existing_total + form.weight.data > 100.0:
-            flash("Total criteria weight cannot exceed 100%.", "warning")
-            return redirect(url_for("admin.criteria", competition_id=form.competition_id.data))
-        db.session.add(
-            Criteria(
-                name=form.name.data.strip(),
-                max_score=form.max_score.data,
-                weight=form.weight.data,
-                competition_id=form.competition_id.data,
+        result = db.session.execute(
+            db.insert(Criteria).from_select(
+                ["name", "max_score", "weight", "competition_id"],
+                db.select(
+                    literal(form.name.data.strip()),
+                    literal(form.max_score.data),
+                    literal(form.weight.data),
+                    literal(form.competition_id.data),
+                ).where(existing_total + form.weight.data <= 100.0),
             )
         )
+        if result.rowcount == 0:
+            db.session.rollback()
+            flash("Total criteria weight cannot exceed 100%.", "warning")
+            return redirect(url_for("admin.criteria", competition_id=form.competition_id.data))
         db.session.commit()
         flash("Criteria added.", "success")
         return redirect(url_for("admin.criteria", competition_id=form.competition_id.data))
 
     criteria_list = (
-        Criteria.query.filter_by(competition_id=competition_id).order_by(Criteria.name).all()
+        Criteria.query.filter_by(competition_id=competition_id)
+        .order_by(Criteria.name)
+        .options(*strict_loading())
+        .all()
         if competition_id
         else []
     )
-    current_weight_total = (
-        db.session.query(db.func.coalesce(db.func.sum(Criteria.weight), 0.0))
-        .filter(Criteria.competition_id == competition_id)
-        .scalar()
-        if competition_id
-        else 0.0
-    )
+    current_weight_total = sum((item.weight for item in criteria_list), 0.0)
     return render_template(
         "admin/criteria.html",
         form=form,
@@ -370,7 +482,7 @@ def criteria():
 @login_required
 @role_required("admin")
 def delete_criteria(criteria_id):
-    criteria_item = Criteria.query.get_or_404(criteria_id)
+    criteria_item = db.get_or_404(Criteria, criteria_id)
     db.session.delete(criteria_item)
     db.session.commit()
     flash("Criteria deleted.", "success")
@@ -383,26 +495,42 @@ def delete_criteria(criteria_id):
 def accounts():
     form = AccountForm()
     if form.validate_on_submit():
-        if User.query.filter_by(username=form.username.data.strip()).first():
+        user = User(
+            username=form.username.data.strip(),
+            role=form.role.data,
+            is_primary=False,
+        )
+        user.competition_id = None
+        user.set_password(form.password.data)
+        db.session.add(user)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
             flash("Username already exists.", "warning")
         else:
-            user = User(
-                username=form.username.data.strip(),
-                role=form.role.data,
-                is_primary=False,
-            )
-            user.competition_id = None
-            user.set_password(form.password.data)
-            db.session.add(user)
-            db.session.commit()
             flash("Account created.", "success")
         return redirect(url_for("admin.accounts"))
 
-    users = User.query.filter_by(role="admin").order_by(User.username).all()
+    after = request.args.get("after")
+    users_query = User.query.filter_by(role="admin")
+    if after:
+        users_query = users_query.filter(User.username > after)
+    users = (
+        users_query.order_by(User.username)
+        .options(*strict_loading())
+        .limit(PAGE_SIZE + 1)
+        .all()
+    )
+    next_after = None
+    if len(users) > PAGE_SIZE:
+        users = users[:PAGE_SIZE]
+        next_after = users[-1].username
     return render_template(
         "admin/accounts.html",
         form=form,
         users=users,
+        next_after=next_after,
     )
 
 
@@ -410,7 +538,7 @@ def accounts():
 @login_required
 @role_required("admin")
 def delete_account(user_id):
-    user = User.query.get_or_404(user_id)
+    user = db.get_or_404(User, user_id)
     if user.is_primary:
         flash("Primary admin account cannot be deleted.", "danger")
         return redirect(url_for("admin.accounts"))
@@ -443,25 +571,26 @@ def change_password():
 @login_required
 @role_required("admin")
 def results():
-    competitions_list = Competition.query.order_by(Competition.name).all()
+    competitions_list = competitions_ordered()
     event_id = request.args.get("event_id", type=int)
     if event_id:
-        event = Event.query.get_or_404(event_id)
+        event = db.get_or_404(Event, event_id)
+        events = Event.query.filter_by(status="active").order_by(Event.created_at.desc()).all()
     else:
-        event = _get_active_event()
+        event = get_active_event()
+        events = [event]
 
     competition_id = request.args.get("competition_id", type=int)
     if not competition_id and competitions_list:
         competition_id = competitions_list[0].id
 
-    competition = Competition.query.get(competition_id) if competition_id else None
+    competition = _load_competition(competition_id) if competition_id else None
     criteria_items = []
     results_rows = []
     if competition:
-        criteria_items = Criteria.query.filter_by(competition_id=competition.id).order_by(Criteria.name).all()
-        results_rows = _calculate_results(event.id, competition.id)
+        criteria_items = competition.criteria
+        results_rows = _calculate_results(event, competition)
 
-    events = Event.query.filter_by(status="active").order_by(Event.created_at.desc()).all()
     return render_template(
         "admin/results.html",
         competitions=competitions_list,
@@ -477,69 +606,68 @@ def results():
 @login_required
 @role_required("admin")
 def scoring():
-    competitions_list = Competition.query.order_by(Competition.name).all()
+    competitions_list = competitions_ordered()
     event_id = request.args.get("event_id", type=int)
     if event_id:
-        event = Event.query.get_or_404(event_id)
+        event = db.get_or_404(Event, event_id)
+        events = Event.query.filter_by(status="active").order_by(Event.created_at.desc()).all()
     else:
-        event = _get_active_event()
+        event = get_active_event()
+        events = [event]
 
     competition_id = request.args.get("competition_id", type=int)
     if not competition_id and competitions_list:
         competition_id = competitions_list[0].id
 
-    competition = Competition.query.get(competition_id) if competition_id else None
+    competition = _find_competition(competitions_list, competition_id)
     criteria_items = []
     judge_breakdown = []
     has_scores = False
 
+    scores = []
     if competition:
-        criteria_items = Criteria.query.filter_by(competition_id=competition.id).order_by(Criteria.name).all()
-        judges = _competition_judges_query(competition.id).all()
+        scores = db.session.execute(
+            db.select(
+                Score.judge_id,
+                Score.contestant_id,
+                Score.criteria_id,
+                Score.score,
+            ).where(
+                Score.event_id == event.id,
+                Score.competition_id == competition.id,
+            )
+        ).all()
+
+    if scores:
+        # The breakdown lists are only needed once there is something to show.
+        has_scores = True
+        criteria_items = (
+            Criteria.query.filter_by(competition_id=competition.id)
+            .order_by(Criteria.name)
+            .options(*strict_loading())
+            .all()
+        )
+        judges = _competition_judges_query(competition.id).options(*strict_loading()).all()
         contestants = (
             Contestant.query.filter_by(competition_id=competition.id)
             .order_by(Contestant.name)
+            .options(*strict_loading())
             .all()
         )
-        scores = Score.query.filter_by(
-            event_id=event.id,
-            competition_id=competition.id,
-        ).all()
-
-        has_scores = len(scores) > 0
         score_lookup = {}
         judge_ids_with_scores = set()
-        for score in scores:
-            score_lookup[(score.judge_id, score.contestant_id, score.criteria_id)] = score.score
-            judge_ids_with_scores.add(score.judge_id)
+        for judge_id, contestant_id, criteria_id, raw_score in scores:
+            score_lookup[(judge_id, contestant_id, criteria_id)] = raw_score
+            judge_ids_with_scores.add(judge_id)
 
+        criteria_factors = _criteria_factors(criteria_items)
         for judge in judges:
             if judge.id not in judge_ids_with_scores:
                 continue
-            rows = []
-            for contestant in contestants:
-                criteria_scores = {}
-                total_weighted = 0.0
-                for criteria_item in criteria_items:
-                    raw_score = score_lookup.get(
-                        (judge.id, contestant.id, criteria_item.id)
-                    )
-                    criteria_scores[criteria_item.id] = raw_score
-                    if raw_score is not None and criteria_item.max_score:
-                        total_weighted += (
-                            raw_score / criteria_item.max_score
-                        ) * criteria_item.weight
-                rows.append(
-                    {
-                        "contestant": contestant.name,
-                        "criteria_scores": criteria_scores,
-                        "total": min(total_weighted, 100.0),
-                    }
-                )
+            rows = _judge_score_rows(judge.id, contestants, criteria_factors, score_lookup)
             judge_breakdown.append({"judge": judge, "rows": rows})
 
-    events = Event.query.filter_by(status="active").order_by(Event.created_at.desc()).all()
-    return render_template(
+    return _stream_page(
         "admin/scoring.html",
         competitions=competitions_list,
         events=events,
@@ -557,10 +685,12 @@ def scoring():
 def results_pdf():
     event_id = request.args.get("event_id", type=int)
     competition_id = request.args.get("competition_id", type=int)
-    event = Event.query.get_or_404(event_id)
-    competition = Competition.query.get_or_404(competition_id)
-    results_rows = _calculate_results(event.id, competition.id)
-    criteria_items = Criteria.query.filter_by(competition_id=competition.id).order_by(Criteria.name).all()
+    event = db.get_or_404(Event, event_id)
+    competition = _load_competition(competition_id)
+    if competition is None:
+        abort(404)
+    results_rows = _calculate_results(event, competition)
+    criteria_items = competition.criteria
 
     pdf_bytes = render_results_pdf(event, competition, results_rows, criteria_items)
     filename = f"results_{competition.slug}_{event.id}.pdf"
@@ -576,7 +706,7 @@ def results_pdf():
 @role_required("admin")
 def history():
     events = Event.query.filter_by(status="completed").order_by(Event.created_at.desc()).all()
-    competitions = Competition.query.order_by(Competition.name).all()
+    competitions = competitions_ordered()
 
     event_groups = [
         {
@@ -599,7 +729,7 @@ def settings():
     reset_form = ResetDatabaseForm(prefix="reset")
     password_form = ChangePasswordForm(prefix="pw")
     event_form = EventTitleForm(prefix="event")
-    active_event = _get_active_event()
+    active_event = get_active_event()
     if request.method == "GET" and active_event:
         event_form.name.data = active_event.name
 
@@ -614,17 +744,19 @@ def settings():
                     return redirect(url_for("admin.settings"))
 
                 db.session.query(Score).delete(synchronize_session=False)
+                db.session.execute(judge_competitions.delete())
+                db.session.query(User).filter(User.is_primary.is_(False)).delete(
+                    synchronize_session=False
+                )
                 db.session.query(Criteria).delete(synchronize_session=False)
                 db.session.query(Contestant).delete(synchronize_session=False)
                 db.session.query(Judge).delete(synchronize_session=False)
                 db.session.query(Competition).delete(synchronize_session=False)
                 db.session.query(Event).delete(synchronize_session=False)
-                db.session.query(User).filter(User.is_primary.is_(False)).delete(
-                    synchronize_session=False
-                )
                 db.session.commit()
+                clear_active_event_cache()
 
-                _get_active_event()
+                get_active_event()
                 flash("Database reset completed.", "success")
                 return redirect(url_for("admin.settings"))
         elif "pw-submit" in request.form:
@@ -657,72 +789,92 @@ def settings():
 @login_required
 @role_required("admin")
 def close_event():
-    active_event = _get_active_event()
-    active_event.status = "completed"
-    active_event.completed_at = datetime.utcnow()
-    db.session.add(active_event)
-
-    new_event = Event(name=f"Event {datetime.utcnow().strftime('%Y-%m-%d %H:%M')}", status="active")
-    db.session.add(new_event)
+    now = datetime.utcnow()
+    db.session.execute(
+        db.update(Event)
+        .where(Event.status == "active")
+        .values(status="completed", completed_at=now)
+    )
+    db.session.execute(
+        db.insert(Event).values(name=f"Event {now:%Y-%m-%d %H:%M}", status="active")
+    )
     db.session.commit()
+    clear_active_event_cache()
 
     flash("Event closed and archived. New event started and setup cleared.", "success")
     return redirect(url_for("admin.history"))
 
 
-def _build_judge_breakdown(event_id, competition_id, criteria_items):
-    judges = _competition_judges_query(competition_id).all()
-    contestants = (
-        Contestant.query.filter_by(competition_id=competition_id)
-        .order_by(Contestant.name)
-        .all()
-    )
-    scores = Score.query.filter_by(
-        event_id=event_id,
-        competition_id=competition_id,
+def _build_judge_breakdown(event_id, competition):
+    competition_id = competition.id
+    criteria_items = competition.criteria
+    judges = _competition_judges_query(competition_id).options(*strict_loading()).all()
+    contestants = competition.contestants
+    scores = db.session.execute(
+        db.select(
+            Score.judge_id,
+            Score.contestant_id,
+            Score.criteria_id,
+            Score.score,
+        ).where(
+            Score.event_id == event_id,
+            Score.competition_id == competition_id,
+        )
     ).all()
 
-    score_lookup = {}
-    for score in scores:
-        score_lookup[(score.judge_id, score.contestant_id, score.criteria_id)] = score.score
+    score_lookup = {
+        (judge_id, contestant_id, criteria_id): raw_score
+        for judge_id, contestant_id, criteria_id, raw_score in scores
+    }
 
+    criteria_factors = _criteria_factors(criteria_items)
     judge_breakdown = []
     for judge in judges:
-        rows = []
-        for contestant in contestants:
-            criteria_scores = {}
-            total_weighted = 0.0
-            for criteria_item in criteria_items:
-                raw_score = score_lookup.get(
-                    (judge.id, contestant.id, criteria_item.id)
-                )
-                criteria_scores[criteria_item.id] = raw_score
-                if raw_score is not None and criteria_item.max_score:
-                    total_weighted += (
-                        raw_score / criteria_item.max_score
-                    ) * criteria_item.weight
-            rows.append(
-                {
-                    "contestant": contestant.name,
-                    "criteria_scores": criteria_scores,
-                    "total": min(total_weighted, 100.0),
-                }
-            )
+        rows = _judge_score_rows(judge.id, contestants, criteria_factors, score_lookup)
         judge_breakdown.append({"judge": judge, "rows": rows})
     return judge_breakdown
 
 
+def _criteria_factors(criteria_items):
+    return [
+        (criteria_item.id, criteria_item.max_score, criteria_item.weight)
+        for criteria_item in criteria_items
+    ]
+
+
+def _judge_score_rows(judge_id, contestants, criteria_factors, score_lookup):
+    rows = []
+    for contestant in contestants:
+        criteria_scores = {}
+        total_weighted = 0.0
+        for criteria_id, max_score, weight in criteria_factors:
+            raw_score = score_lookup.get((judge_id, contestant.id, criteria_id))
+            criteria_scores[criteria_id] = raw_score
+            if raw_score is not None and max_score:
+                total_weighted += (raw_score / max_score) * weight
+        rows.append(
+            {
+                "contestant": contestant.name,
+                "criteria_scores": criteria_scores,
+                "total": min(total_weighted, 100.0),
+            }
+        )
+    return rows
+
+
 @admin_bp.route("/history/results")
 @login_required
 @role_required("admin")
 def history_results():
     event_id = request.args.get("event_id", type=int)
     competition_id = request.args.get("competition_id", type=int)
-    event = Event.query.get_or_404(event_id)
-    competition = Competition.query.get_or_404(competition_id)
-    criteria_items = Criteria.query.filter_by(competition_id=competition.id).order_by(Criteria.name).all()
-    results_rows = _calculate_results(event.id, competition.id)
-    judge_breakdown = _build_judge_breakdown(event.id, competition.id, criteria_items)
+    event = db.get_or_404(Event, event_id)
+    competition = _load_competition(competition_id)
+    if competition is None:
+        abort(404)
+    criteria_items = competition.criteria
+    results_rows = _calculate_results(event, competition)
+    judge_breakdown = _build_judge_breakdown(event.id, competition)
 
     return render_template(
         "admin/history_results.html",
@@ -734,41 +886,78 @@ def history_results():
     )
 
 
-def _calculate_results(event_id, competition_id):
-    contestants = Contestant.query.filter_by(competition_id=competition_id).all()
-    criteria_items = Criteria.query.filter_by(competition_id=competition_id).order_by(Criteria.name).all()
+def _calculate_results(event, competition):
+    contestants = tuple((contestant.id, contestant.name) for contestant in competition.contestants)
+    if not contestants:
+        return []
+    criteria_factors = tuple(_criteria_factors(competition.criteria))
+    if event.status != "completed" or not criteria_factors:
+        return _score_results(event.id, competition.id, contestants, criteria_factors)
+
+    # Contestants and criteria are live tables, so the key carries them, and scores of a
+    # completed event only change by deletion, so the row count versions it.
+    score_count = db.session.scalar(
+        _count_query(
+            Score,
+            Score.event_id == event.id,
+            Score.competition_id == competition.id,
+        )
+    )
+    return _completed_results(
+        event.id,
+        event.completed_at,
+        competition.id,
+        contestants,
+        criteria_factors,
+        score_count,
+    )
+
+
+@lru_cache(maxsize=32)
+def _completed_results(
+    event_id, completed_at, competition_id, contestants, criteria_factors, score_count
+):
+    return _score_results(event_id, competition_id, contestants, criteria_factors)
+
+
+def _score_results(event_id, competition_id, contestants, criteria_factors):
+    score_rows = []
+    if criteria_factors:
+        score_rows = (
+            db.session.query(
+                Score.contestant_id,
+                Score.criteria_id,
+                func.avg(Score.score),
+            )
+            .filter(
+                Score.event_id == event_id,
+                Score.competition_id == competition_id,
+            )
+            .group_by(Score.contestant_id, Score.criteria_id)
+            .all()
+        )
+    averages = {}
+    for contestant_id, criteria_id, avg_score in score_rows:
+        averages.setdefault(contestant_id, {})[criteria_id] = avg_score
 
     results = []
-    for contestant in contestants:
+    for contestant_id, contestant_name in contestants:
+        contestant_averages = averages.get(contestant_id, {})
         total_weighted = 0.0
         total_raw = 0.0
         criteria_weighted_totals = {}
         criteria_raw_totals = {}
-        for criteria_item in criteria_items:
-            scores = (
-                Score.query.filter_by(
-                    event_id=event_id,
-                    competition_id=competition_id,
-                    contestant_id=contestant.id,
-                    criteria_id=criteria_item.id,
-                ).all()
-            )
-            scores_sum = sum(score.score for score in scores)
-            score_count = len(scores)
-            avg_raw = scores_sum / score_count if score_count else 0.0
-            weighted_total = (
-                (avg_raw / criteria_item.max_score) * criteria_item.weight
-                if criteria_item.max_score
-                else 0.0
-            )
-            criteria_raw_totals[criteria_item.id] = avg_raw
-            criteria_weighted_totals[criteria_item.id] = weighted_total
+        for criteria_id, max_score, weight in criteria_factors:
+            avg_raw = contestant_averages.get(criteria_id, 0.0)
+            weighted_total = (avg_raw / max_score) * weight if max_score else 0.0
+            criteria_raw_totals[criteria_id] = avg_raw
+            criteria_weighted_totals[criteria_id] = weighted_total
             total_raw += avg_raw
             total_weighted += weighted_total
         total_weighted = min(total_weighted, 100.0)
         results.append(
             {
-                "contestant": contestant.name,
+                "contestant": contestant_name,
                 "total": total_weighted,
                 "total_raw": total_raw,
                 "criteria_totals": criteria_weighted_totals,
@@ -776,5 +965,5 @@ def _calculate_results(event_id, competition_id):
             }
         )
 
-    results.sort(key=lambda row: row["total"], reverse=True)
+    results.sort(key=itemgetter("total"), reverse=True)
     return results
@@ -3,6 +3,7 @@ from flask_login import login_required, login_user, logout_user
 
 from . import auth_bp
 from .forms import LoginForm
+from ..extensions import db
 from ..models import User
 
 
@@ -12,6 +13,9 @@ def login():
     if form.validate_on_submit():
         user = User.query.filter_by(username=form.username.data.strip()).first()
         if user and user.check_password(form.password.data):
+            if user.password_needs_rehash():
+                user.set_password(form.password.data)
+                db.session.commit()
             if user.role == "judge":
                 judge = user.judge
                 has_competition = False
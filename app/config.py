@@ -9,3 +9,8 @@ class Config:
         f"sqlite:///{os.path.join(BASE_DIR, 'litmus.db')}",
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "query_cache_size": int(os.getenv("SQLALCHEMY_QUERY_CACHE_SIZE", "1200")),
+    }
+    BCRYPT_LOG_ROUNDS = int(os.getenv("BCRYPT_LOG_ROUNDS", "12"))
+    JINJA_BYTECODE_CACHE_DIR = os.getenv("JINJA_BYTECODE_CACHE_DIR")
@@ -1,6 +1,8 @@
+from flask import current_app
 from flask_bcrypt import Bcrypt
 from flask_login import LoginManager
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.orm import raiseload
 
 
 db = SQLAlchemy()
@@ -9,3 +11,10 @@ login_manager.login_view = "auth.login"
 login_manager.login_message_category = "warning"
 
 bcrypt = Bcrypt()
+
+
+def strict_loading():
+    # Raise on unplanned lazy loads while debugging so N+1 access surfaces early.
+    if current_app.debug or current_app.testing:
+        return (raiseload("*"),)
+    return ()
@@ -1,23 +1,38 @@
-from flask import flash, redirect, render_template, request, url_for
+from functools import lru_cache
+from operator import attrgetter
+
+from flask import flash, g, redirect, render_template, request, url_for
 from flask_login import current_user, login_required
 from flask_wtf import FlaskForm
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
 from wtforms import FloatField, HiddenField, SubmitField
 from wtforms.validators import DataRequired, NumberRange
 
 from . import judge_bp
-from ..extensions import db
-from ..models import Competition, Contestant, Criteria, Event, Judge, Score
+from ..extensions import db, strict_loading
+from ..models import Competition, Contestant, Criteria, Judge, Score
 from ..utils.decorators import role_required
-
-
-def _get_active_event():
-    event = Event.query.filter_by(status="active").first()
-    if event:
-        return event
-    event = Event(name="Main Event", status="active")
-    db.session.add(event)
-    db.session.commit()
-    return event
+from ..utils.events import get_active_event
+
+
+def _current_judge():
+    if "judge" in g:
+        return g.judge
+    judge = None
+    if current_user.judge_id:
+        judge = (
+            db.session.execute(
+                db.select(Judge)
+                .options(joinedload(Judge.competitions))
+                .filter_by(id=current_user.judge_id)
+            )
+            .unique()
+            .scalar_one_or_none()
+        )
+    g.judge = judge
+    return judge
 
 
 def _judge_competition_ids(judge):
@@ -29,21 +44,37 @@ def _judge_competition_ids(judge):
     return competition_ids
 
 
+@lru_cache(maxsize=64)
+def _score_form_class(criteria_fields):
+    class JudgeScoreForm(FlaskForm):
+        contestant_id = HiddenField(validators=[DataRequired()])
+        submit = SubmitField("Submit Score")
+
+    for criteria_id, name, max_score in criteria_fields:
+        field = FloatField(
+            f"{name} (max {max_score})",
+            validators=[DataRequired(), NumberRange(min=0, max=max_score)],
+        )
+        setattr(JudgeScoreForm, f"criteria_{criteria_id}", field)
+    return JudgeScoreForm
+
+
 @judge_bp.route("/")
 @login_required
 @role_required("judge")
 def portal():
     competitions = []
-    judge = Judge.query.get(current_user.judge_id) if current_user.judge_id else None
-    competition_ids = _judge_competition_ids(judge)
-    if competition_ids:
-        competitions = (
-            Competition.query.filter(Competition.id.in_(competition_ids))
-            .order_by(Competition.name)
-            .all()
-        )
+    judge = _current_judge()
+    if judge:
+        # The assigned competitions are already loaded with the judge.
+        competitions = list(judge.competitions)
+        if judge.competition_id not in {competition.id for competition in competitions}:
+            primary = db.session.get(Competition, judge.competition_id)
+            if primary:
+                competitions.append(primary)
+        competitions.sort(key=attrgetter("name"))
     elif current_user.competition_id:
-        competition = Competition.query.get(current_user.competition_id)
+        competition = db.session.get(Competition, current_user.competition_id)
         competitions = [competition] if competition else []
     return render_template("judge/portal.html", competitions=competitions)
 
@@ -52,47 +83,45 @@ def portal():
 @login_required
 @role_required("judge")
 def score(competition_id):
-    competition = Competition.query.get_or_404(competition_id)
-    judge = Judge.query.get(current_user.judge_id) if current_user.judge_id else None
+    # Loading the judge first puts its competitions in the identity map for get_or_404.
+    judge = _current_judge()
+    competition = db.get_or_404(Competition, competition_id)
     if competition_id not in _judge_competition_ids(judge):
         flash("Judge account is not linked to this competition.", "warning")
         return redirect(url_for("judge.portal"))
 
-    criteria_items = Criteria.query.filter_by(competition_id=competition.id).order_by(Criteria.name).all()
+    criteria_items = (
+        Criteria.query.filter_by(competition_id=competition.id)
+        .options(*strict_loading())
+        .order_by(Criteria.name)
+        .all()
+    )
     contestants = (
         Contestant.query.filter_by(competition_id=competition.id)
+        .options(*strict_loading())
         .order_by(Contestant.name)
         .all()
     )
-    active_event = _get_active_event()
+    active_event = get_active_event()
 
-    class JudgeScoreForm(FlaskForm):
-        contestant_id = HiddenField(validators=[DataRequired()])
-        submit = SubmitField("Submit Score")
-
-    for criteria_item in criteria_items:
-        field_name = f"criteria_{criteria_item.id}"
-        field = FloatField(
-            f"{criteria_item.name} (max {criteria_item.max_score})",
-            validators=[DataRequired(), NumberRange(min=0, max=criteria_item.max_score)],
-        )
-        setattr(JudgeScoreForm, field_name, field)
-
-    score_form = JudgeScoreForm()
+    score_form = _score_form_class(
+        tuple((item.id, item.name, item.max_score) for item in criteria_items)
+    )()
 
     scored_contestants = set()
     if criteria_items and contestants:
-        scores = Score.query.filter_by(
-            event_id=active_event.id,
-            competition_id=competition.id,
-            judge_id=judge.id,
-        ).all()
-        score_counts = {}
-        for score in scores:
-            score_counts[score.contestant_id] = score_counts.get(score.contestant_id, 0) + 1
-        for contestant in contestants:
-            if score_counts.get(contestant.id) == len(criteria_items):
-                scored_contestants.add(contestant.id)
+        scored_contestants = set(
+            db.session.scalars(
+                db.select(Score.contestant_id)
+                .where(
+                    Score.event_id == active_event.id,
+                    Score.competition_id == competition.id,
+                    Score.judge_id == judge.id,
+                )
+                .group_by(Score.contestant_id)
+                .having(func.count() == len(criteria_items))
+            )
+        )
 
     if score_form.validate_on_submit():
         try:
@@ -107,33 +136,41 @@ def score(competition_id):
             flash("Scores already submitted for this contestant.", "warning")
             return redirect(url_for("judge.score", competition_id=competition.id))
 
-        existing_count = Score.query.filter_by(
-            event_id=active_event.id,
-            competition_id=competition.id,
-            judge_id=judge.id,
-            contestant_id=contestant_id,
-        ).count()
-        if existing_count > 0:
-            flash("Scores already submitted for this contestant.", "warning")
-            return redirect(url_for("judge.score", competition_id=competition.id))
-
-        for criteria_item in criteria_items:
-            field_name = f"criteria_{criteria_item.id}"
-            score_value = getattr(score_form, field_name).data
-            score_entry = Score(
+        already_scored = db.session.query(
+            Score.query.filter_by(
                 event_id=active_event.id,
                 competition_id=competition.id,
                 judge_id=judge.id,
                 contestant_id=contestant_id,
-                criteria_id=criteria_item.id,
-                created_by=current_user.id,
-                score=score_value,
-                locked=True,
-            )
-            db.session.add(score_entry)
+            ).exists()
+        ).scalar()
+        if already_scored:
+            flash("Scores already submitted for this contestant.", "warning")
+            return redirect(url_for("judge.score", competition_id=competition.id))
 
-        db.session.commit()
-        flash("Scores submitted.", "success")
+        score_rows = [
+            {
+                "event_id": active_event.id,
+                "competition_id": competition.id,
+                "judge_id": judge.id,
+                "contestant_id": contestant_id,
+                "criteria_id": criteria_item.id,
+                "created_by": current_user.id,
+                "score": getattr(score_form, f"criteria_{criteria_item.id}").data,
+                "locked": True,
+            }
+            for criteria_item in criteria_items
+        ]
+        try:
+            if score_rows:
+                db.session.execute(db.insert(Score), score_rows)
+                db.session.commit()
+        except IntegrityError:
+            # A concurrent submission for this contestant won the race.
+            db.session.rollback()
+            flash("Scores already submitted for this contestant.", "warning")
+        else:
+            flash("Scores submitted.", "success")
         return redirect(url_for("judge.score", competition_id=competition.id))
     elif request.method == "POST":
         flash("Please provide valid scores for all criteria.", "warning")
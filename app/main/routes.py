@@ -1,10 +1,21 @@
 from flask import render_template
 
 from . import main_bp
-from ..models import Competition
+from ..extensions import db
+from ..models import Competition, Event, User
+from ..utils.competitions import competitions_ordered
 
 
 @main_bp.route("/")
 def home():
-    competitions = Competition.query.order_by(Competition.name).all()
+    competitions = competitions_ordered()
     return render_template("main/home.html", competitions=competitions)
+
+
+@main_bp.route("/ready")
+def ready():
+    inspector = db.inspect(db.engine)
+    tables = (Competition.__tablename__, Event.__tablename__, User.__tablename__)
+    if all(inspector.has_table(table) for table in tables):
+        return "ok"
+    return "database not initialized", 503
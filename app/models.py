@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from flask import current_app
 from flask_login import UserMixin
 
 from .extensions import bcrypt, db, login_manager
@@ -14,6 +15,7 @@ judge_competitions = db.Table(
         db.ForeignKey("competition.id"),
         primary_key=True,
     ),
+    db.Index("idx_judge_competitions_competition", "competition_id"),
 )
 
 
@@ -24,6 +26,18 @@ class Event(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     completed_at = db.Column(db.DateTime)
 
+    # Partial indexes only exist on these dialects; elsewhere a plain unique index on
+    # status would reject a second completed event.
+    __table_args__ = (
+        db.Index(
+            "uq_event_single_active",
+            "status",
+            unique=True,
+            postgresql_where=db.text("status = 'active'"),
+            sqlite_where=db.text("status = 'active'"),
+        ).ddl_if(dialect=("sqlite", "postgresql")),
+    )
+
 
 class Competition(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -35,15 +49,25 @@ class Competition(db.Model):
         back_populates="competitions",
     )
     contestants = db.relationship(
-        "Contestant", backref="competition", cascade="all, delete-orphan"
+        "Contestant",
+        backref="competition",
+        cascade="all, delete-orphan",
+        order_by="Contestant.name",
+    )
+    criteria = db.relationship(
+        "Criteria",
+        backref="competition",
+        cascade="all, delete-orphan",
+        order_by="Criteria.name",
     )
-    criteria = db.relationship("Criteria", backref="competition", cascade="all, delete-orphan")
 
 
 class Judge(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(120), nullable=False)
-    competition_id = db.Column(db.Integer, db.ForeignKey("competition.id"), nullable=False)
+    competition_id = db.Column(
+        db.Integer, db.ForeignKey("competition.id"), nullable=False, index=True
+    )
     competitions = db.relationship(
         "Competition",
         secondary=judge_competitions,
@@ -83,6 +107,12 @@ class User(UserMixin, db.Model):
     def check_password(self, password):
         return bcrypt.check_password_hash(self.password_hash, password)
 
+    def password_needs_rehash(self):
+        # bcrypt hashes look like $2b$<rounds>$<salt+digest>.
+        parts = self.password_hash.split("$")
+        rounds = current_app.config.get("BCRYPT_LOG_ROUNDS", 12)
+        return len(parts) < 4 or parts[2] != f"{rounds:02d}"
+
 
 class Score(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -105,9 +135,17 @@ class Score(db.Model):
             "criteria_id",
             name="uq_score_entry",
         ),
+        db.Index(
+            "idx_score_full",
+            "event_id",
+            "competition_id",
+            "contestant_id",
+            "criteria_id",
+            "score",
+        ),
     )
 
 
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    return db.session.get(User, int(user_id))
@@ -1,46 +1,63 @@
+from functools import lru_cache
+
 from flask import flash, redirect, render_template, request, url_for
 from flask_login import current_user, login_required
 from werkzeug.exceptions import Forbidden
 from flask_wtf import FlaskForm
 from wtforms import FloatField, SelectField, SubmitField
 from wtforms.validators import DataRequired, NumberRange
+from sqlalchemy import func, union
 
 from . import tabulator_bp
 from ..extensions import db
-from ..models import Competition, Contestant, Criteria, Event, Judge, Score, judge_competitions
+from ..models import Competition, Contestant, Criteria, Judge, Score, judge_competitions
+from ..utils.competitions import competitions_ordered
 from ..utils.decorators import role_required
+from ..utils.events import get_active_event
 
 
-def _get_active_event():
-    event = Event.query.filter_by(status="active").first()
-    if event:
-        return event
-    event = Event(name="Main Event", status="active")
-    db.session.add(event)
-    db.session.commit()
-    return event
+def _competition_judges_query(competition_id):
+    judge_ids = union(
+        db.select(Judge.id).where(Judge.competition_id == competition_id),
+        db.select(judge_competitions.c.judge_id).where(
+            judge_competitions.c.competition_id == competition_id
+        ),
+    )
+    return Judge.query.filter(Judge.id.in_(judge_ids)).order_by(Judge.name)
 
 
-def _competition_judges_query(competition_id):
-    return (
-        Judge.query.outerjoin(
-            judge_competitions,
-            Judge.id == judge_competitions.c.judge_id,
-        )
-        .filter(
-            (Judge.competition_id == competition_id)
-            | (judge_competitions.c.competition_id == competition_id)
+@lru_cache(maxsize=64)
+def _score_form_class(criteria_fields):
+    class DynamicScoreForm(FlaskForm):
+        judge_id = SelectField("Judge", coerce=int, validators=[DataRequired()])
+        contestant_id = SelectField("Contestant", coerce=int, validators=[DataRequired()])
+        submit_save = SubmitField("Save Score")
+        submit_lock = SubmitField("Lock Score")
+
+    for criteria_id, name, max_score in criteria_fields:
+        field = FloatField(
+            f"{name} (max {max_score})",
+            validators=[DataRequired(), NumberRange(min=0, max=max_score)],
         )
-        .distinct()
-        .order_by(Judge.name)
-    )
+        setattr(DynamicScoreForm, f"criteria_{criteria_id}", field)
+    return DynamicScoreForm
+
+
+def _score_entries(event_id, competition_id, judge_id, contestant_id):
+    scores = Score.query.filter_by(
+        event_id=event_id,
+        competition_id=competition_id,
+        judge_id=judge_id,
+        contestant_id=contestant_id,
+    ).all()
+    return {score.criteria_id: score for score in scores}
 
 
 @tabulator_bp.route("/")
 @login_required
 @role_required("tabulator")
 def portal():
-    competitions = Competition.query.order_by(Competition.name).all()
+    competitions = competitions_ordered()
     if current_user.competition_id:
         competitions = Competition.query.filter_by(id=current_user.competition_id).all()
     return render_template("tabulator/portal.html", competitions=competitions)
@@ -53,7 +70,7 @@ def score_entry(competition_id):
     if current_user.competition_id and current_user.competition_id != competition_id:
         flash("You are not assigned to this competition portal.", "warning")
         return redirect(url_for("tabulator.portal"))
-    competition = Competition.query.get_or_404(competition_id)
+    competition = db.get_or_404(Competition, competition_id)
     judges = _competition_judges_query(competition_id).all()
     contestants = (
         Contestant.query.filter_by(competition_id=competition_id)
@@ -66,25 +83,13 @@ def score_entry(competition_id):
         .all()
     )
 
-    class DynamicScoreForm(FlaskForm):
-        judge_id = SelectField("Judge", coerce=int, validators=[DataRequired()])
-        contestant_id = SelectField("Contestant", coerce=int, validators=[DataRequired()])
-        submit_save = SubmitField("Save Score")
-        submit_lock = SubmitField("Lock Score")
-
-    for criteria_item in criteria_items:
-        field_name = f"criteria_{criteria_item.id}"
-        field = FloatField(
-            f"{criteria_item.name} (max {criteria_item.max_score})",
-            validators=[DataRequired(), NumberRange(min=0, max=criteria_item.max_score)],
-        )
-        setattr(DynamicScoreForm, field_name, field)
-
-    form = DynamicScoreForm()
+    form = _score_form_class(
+        tuple((item.id, item.name, item.max_score) for item in criteria_items)
+    )()
     form.judge_id.choices = [(j.id, j.name) for j in judges]
     form.contestant_id.choices = [(c.id, c.name) for c in contestants]
 
-    active_event = _get_active_event()
+    active_event = get_active_event()
     existing_scores = {}
     form_locked = False
 
@@ -92,53 +97,59 @@ def score_entry(competition_id):
         judge_id = form.judge_id.data
         contestant_id = form.contestant_id.data
 
-        locked_exists = (
+        locked_exists = db.session.query(
             Score.query.filter_by(
                 event_id=active_event.id,
                 competition_id=competition_id,
                 contestant_id=contestant_id,
                 locked=True,
-            ).count()
-            > 0
-        )
+            ).exists()
+        ).scalar()
 
         if locked_exists:
             flash("Scores are locked and cannot be edited.", "danger")
             return redirect(url_for("tabulator.score_entry", competition_id=competition_id))
 
+        saved_entries = _score_entries(active_event.id, competition_id, judge_id, contestant_id)
+        new_rows = []
+        updated_rows = []
         for criteria_item in criteria_items:
             field_name = f"criteria_{criteria_item.id}"
             score_value = getattr(form, field_name).data
-            score_entry = Score.query.filter_by(
-                event_id=active_event.id,
-                competition_id=competition_id,
-                judge_id=judge_id,
-                contestant_id=contestant_id,
-                criteria_id=criteria_item.id,
-            ).first()
+            score_entry = saved_entries.get(criteria_item.id)
 
             if not score_entry:
-                score_entry = Score(
-                    event_id=active_event.id,
-                    competition_id=competition_id,
-                    judge_id=judge_id,
-                    contestant_id=contestant_id,
-                    criteria_id=criteria_item.id,
-                    created_by=current_user.id,
-                    score=score_value,
-                    locked=False,
+                new_rows.append(
+                    {
+                        "event_id": active_event.id,
+                        "competition_id": competition_id,
+                        "judge_id": judge_id,
+                        "contestant_id": contestant_id,
+                        "criteria_id": criteria_item.id,
+                        "created_by": current_user.id,
+                        "score": score_value,
+                        "locked": False,
+                    }
                 )
-                db.session.add(score_entry)
             else:
-                score_entry.score = score_value
+                updated_rows.append({"id": score_entry.id, "score": score_value})
+
+        if updated_rows:
+            db.session.execute(db.update(Score), updated_rows)
+        if new_rows:
+            db.session.execute(db.insert(Score), new_rows)
 
         if form.submit_lock.data:
             expected_scores = len(judges) * len(criteria_items)
-            saved_scores = Score.query.filter_by(
-                event_id=active_event.id,
-                competition_id=competition_id,
-                contestant_id=contestant_id,
-            ).count()
+            saved_scores = db.session.scalar(
+                db.select(func.count())
+                .select_from(Score)
+                .where(
+                    Score.event_id == active_event.id,
+                    Score.competition_id == competition_id,
+                    Score.contestant_id == contestant_id,
+                )
+            )
             if saved_scores < expected_scores:
                 db.session.commit()
                 flash(
@@ -180,14 +191,11 @@ def score_entry(competition_id):
     if selected_judge_id and selected_contestant_id:
         form.judge_id.data = selected_judge_id
         form.contestant_id.data = selected_contestant_id
+        saved_entries = _score_entries(
+            active_event.id, competition_id, selected_judge_id, selected_contestant_id
+        )
         for criteria_item in criteria_items:
-            score_entry = Score.query.filter_by(
-                event_id=active_event.id,
-                competition_id=competition_id,
-                judge_id=selected_judge_id,
-                contestant_id=selected_contestant_id,
-                criteria_id=criteria_item.id,
-            ).first()
+            score_entry = saved_entries.get(criteria_item.id)
             existing_scores[criteria_item.id] = score_entry
             if score_entry:
                 getattr(form, f"criteria_{criteria_item.id}").data = score_entry.score
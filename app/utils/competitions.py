@@ -0,0 +1,15 @@
+from flask import g
+
+from ..extensions import db
+from ..models import Competition
+
+
+def competitions_ordered():
+    if "competitions" not in g:
+        g.competitions = db.session.execute(
+            db.select(Competition.id, Competition.name, Competition.slug).order_by(
+                Competition.name
+            )
+        ).all()
+    return g.competitions
+
@@ -5,16 +5,18 @@ from flask_login import current_user
 
 
 def role_required(role):
+    if isinstance(role, (list, tuple, set, frozenset)):
+        allowed_roles = frozenset(role)
+    else:
+        allowed_roles = frozenset((role,))
+
     def decorator(view_func):
         @wraps(view_func)
         def wrapper(*args, **kwargs):
-            if not current_user.is_authenticated:
+            user = current_user._get_current_object()
+            if not user.is_authenticated:
                 abort(401)
-            if isinstance(role, (list, tuple, set)):
-                allowed_roles = set(role)
-            else:
-                allowed_roles = {role}
-            if current_user.role not in allowed_roles:
+            if user.role not in allowed_roles:
                 abort(403)
             return view_func(*args, **kwargs)
 
@@ -0,0 +1,41 @@
+from flask import g
+from sqlalchemy.exc import IntegrityError
+
+from ..extensions import db
+from ..models import Event
+
+
+_active_event_id = None
+
+
+def get_active_event():
+    global _active_event_id
+    event = g.get("active_event")
+    if event is not None:
+        return event
+
+    if _active_event_id is not None:
+        event = db.session.get(Event, _active_event_id)
+        if event and event.status == "active":
+            g.active_event = event
+            return event
+
+    event = Event.query.filter_by(status="active").first()
+    if not event:
+        event = Event(name="Main Event", status="active")
+        db.session.add(event)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Another request created the active event first.
+            db.session.rollback()
+            event = Event.query.filter_by(status="active").one()
+    _active_event_id = event.id
+    g.active_event = event
+    return event
+
+
+def clear_active_event_cache():
+    global _active_event_id
+    _active_event_id = None
+    g.pop("active_event", None)
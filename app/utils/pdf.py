@@ -1,8 +1,63 @@
 import os
+from bisect import bisect_right
+from functools import lru_cache
+from io import BytesIO
+from itertools import accumulate
 
 from fpdf import FPDF
 
 
+# Remembers string widths for the life of one document; the fitting helpers re-measure a lot.
+class _ResultsPDF(FPDF):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._string_widths = {}
+
+    def get_string_width(self, s, normalized=False, markdown=False):
+        key = (
+            self.font_family,
+            self.font_style,
+            self.font_size_pt,
+            self.char_spacing,
+            self.font_stretching,
+            s,
+            normalized,
+            markdown,
+        )
+        width = self._string_widths.get(key)
+        if width is None:
+            width = super().get_string_width(s, normalized, markdown)
+            self._string_widths[key] = width
+        return width
+
+
+LOGO_PATH = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "static",
+        "img",
+        "MseufCatLogo.png",
+    )
+)
+
+
+@lru_cache(maxsize=1)
+def _logo_bytes():
+    if not os.path.exists(LOGO_PATH):
+        return None
+    with open(LOGO_PATH, "rb") as logo_file:
+        return logo_file.read()
+
+
+def _place_logo(pdf):
+    # Read the file once per process; fpdf's own image cache handles reuse per document.
+    logo = _logo_bytes()
+    if logo is None:
+        return
+    pdf.image(BytesIO(logo), x=12, y=10, w=20)
+
+
 def _format_score(value):
     return f"{value:.4f}"
 
@@ -15,10 +70,16 @@ def _ellipsize_to_width(pdf, text, max_width):
     if pdf.get_string_width(ellipsis) >= max_width:
         return ellipsis
 
-    trimmed = text
-    while trimmed and pdf.get_string_width(trimmed + ellipsis) > max_width:
-        trimmed = trimmed[:-1]
-    return trimmed + ellipsis
+    # Core font widths add up per character, so bisect the prefix sums for the cut
+    # and then confirm the boundary with real measurements.
+    char_widths = {char: pdf.get_string_width(char) for char in set(text)}
+    prefix_widths = list(accumulate(char_widths[char] for char in text))
+    cut = bisect_right(prefix_widths, max_width - pdf.get_string_width(ellipsis))
+    while cut and pdf.get_string_width(text[:cut] + ellipsis) > max_width:
+        cut -= 1
+    while cut < len(text) and pdf.get_string_width(text[: cut + 1] + ellipsis) <= max_width:
+        cut += 1
+    return text[:cut] + ellipsis
 
 
 def _split_header_label(pdf, text, max_width):
@@ -29,9 +90,22 @@ def _split_header_label(pdf, text, max_width):
     if len(words) <= 1:
         return _ellipsize_to_width(pdf, text, max_width), ""
 
+    # Estimate every split from per-word widths, then measure only the near-best ones
+    # exactly so ties still resolve to the earliest split.
+    word_widths = [pdf.get_string_width(word) for word in words]
+    space_width = pdf.get_string_width(" ")
+    total_width = sum(word_widths) + space_width * (len(words) - 1)
+    estimates = []
+    left_width = -space_width
+    for index in range(1, len(words)):
+        left_width += space_width + word_widths[index - 1]
+        estimates.append((max(left_width, total_width - left_width - space_width), index))
+    lowest = min(estimates)[0]
+    candidates = [index for estimate, index in estimates if estimate <= lowest + 1e-6]
+
     best_split = None
     best_width = None
-    for index in range(1, len(words)):
+    for index in candidates:
         left = " ".join(words[:index])
         right = " ".join(words[index:])
         max_line = max(
@@ -65,26 +139,17 @@ def _fit_header_font_size(pdf, labels, max_size, min_size):
     return min_size
 
 
-def render_results_pdf(event, competition, results, criteria_items):
-    criteria_count = max(len(criteria_items), 1)
+def _build_results_pdf(competition_name, criteria, rows):
+    criteria_count = max(len(criteria), 1)
     orientation = "P"
-    if criteria_count > 4 or len(results) > 15:
+    if criteria_count > 4 or len(rows) > 15:
         orientation = "L"
 
-    pdf = FPDF(orientation=orientation)
+    pdf = _ResultsPDF(orientation=orientation)
     pdf.set_auto_page_break(auto=True, margin=12)
     pdf.add_page()
 
-    logo_path = os.path.join(
-        os.path.dirname(__file__),
-        "..",
-        "static",
-        "img",
-        "MseufCatLogo.png",
-    )
-    logo_path = os.path.abspath(logo_path)
-    if os.path.exists(logo_path):
-        pdf.image(logo_path, x=12, y=10, w=20)
+    _place_logo(pdf)
 
     pdf.set_text_color(128, 0, 32)
     pdf.set_font("Helvetica", style="B", size=11)
@@ -98,7 +163,7 @@ def render_results_pdf(event, competition, results, criteria_items):
     pdf.cell(
         0,
         8,
-        f"{competition.name} Competition Results",
+        f"{competition_name} Competition Results",
         ln=True,
         align="C",
     )
@@ -116,15 +181,15 @@ def render_results_pdf(event, competition, results, criteria_items):
         body_font = 7
     if criteria_count > 8:
         body_font = 6
-    if len(results) > 20:
+    if len(rows) > 20:
         body_font = max(5, body_font - 1)
     header_font = min(10, body_font + 1)
     row_height = 6 if body_font <= 6 else 7
 
     header_labels = [("Rank", rank_width), ("Contestant", contestant_width)]
     header_labels += [
-        (f"{item.name} ({item.weight:.0f}%)", criteria_width)
-        for item in criteria_items
+        (f"{name} ({weight:.0f}%)", criteria_width)
+        for _, name, weight in criteria
     ]
     header_labels.append(("Total", total_width))
     header_font = _fit_header_font_size(
@@ -151,8 +216,8 @@ def render_results_pdf(event, competition, results, criteria_items):
         align="C",
     )
     criteria_lines = []
-    for item in criteria_items:
-        label = f"{item.name} ({item.weight:.0f}%)"
+    for _, name, weight in criteria:
+        label = f"{name} ({weight:.0f}%)"
         line_one, line_two = _split_header_label(pdf, label, criteria_width)
         criteria_lines.append((line_one, line_two))
         pdf.cell(
@@ -185,19 +250,22 @@ def render_results_pdf(event, competition, results, criteria_items):
     pdf.ln()
 
     pdf.set_font("Helvetica", size=body_font)
-    for index, row in enumerate(results, start=1):
-        pdf.cell(rank_width, row_height, str(index), border=1, align="C")
+    # The body font is fixed from here on, so bind the per-cell calls once.
+    cell = pdf.cell
+    new_line = pdf.ln
+    for index, (contestant, weighted_scores, raw_scores, total) in enumerate(
+        rows, start=1
+    ):
+        cell(rank_width, row_height, str(index), border=1, align="C")
         contestant_text = _ellipsize_to_width(
             pdf,
-            row["contestant"],
+            contestant,
             contestant_width,
         )
-        pdf.cell(contestant_width, row_height, contestant_text, border=1)
-        for item in criteria_items:
-            weighted = row["criteria_totals"].get(item.id, 0)
-            raw = row["criteria_raw_totals"].get(item.id, 0)
+        cell(contestant_width, row_height, contestant_text, border=1)
+        for weighted, raw in zip(weighted_scores, raw_scores):
             score_text = f"{_format_score(weighted)}({_format_score(raw)})"
-            pdf.cell(
+            cell(
                 criteria_width,
                 row_height,
                 _ellipsize_to_width(pdf, score_text, criteria_width),
@@ -206,13 +274,38 @@ def render_results_pdf(event, competition, results, criteria_items):
             )
         total_text = _ellipsize_to_width(
             pdf,
-            _format_score(row["total"]),
+            _format_score(total),
             total_width,
         )
-        pdf.cell(total_width, row_height, total_text, border=1, align="C")
-        pdf.ln()
+        cell(total_width, row_height, total_text, border=1, align="C")
+        new_line()
+
+    return pdf
+
+
+def _results_snapshot(competition, results, criteria_items):
+    # Everything the document depends on, as hashable values projected onto the
+    # criteria order so the cell loop only walks tuples.
+    criteria = tuple((item.id, item.name, item.weight) for item in criteria_items)
+    criteria_ids = [criteria_id for criteria_id, _, _ in criteria]
+    rows = tuple(
+        (
+            row["contestant"],
+            tuple(row["criteria_totals"].get(criteria_id, 0) for criteria_id in criteria_ids),
+            tuple(row["criteria_raw_totals"].get(criteria_id, 0) for criteria_id in criteria_ids),
+            row["total"],
+        )
+        for row in results
+    )
+    return competition.name, criteria, rows
+
+
+@lru_cache(maxsize=64)
+def _results_pdf_bytes(competition_name, criteria, rows):
+    pdf = _build_results_pdf(competition_name, criteria, rows)
+    return bytes(pdf.output())
+
+
+def render_results_pdf(event, competition, results, criteria_items):
+    return _results_pdf_bytes(*_results_snapshot(competition, results, criteria_items))
 
-    pdf_bytes = pdf.output(dest="S")
-    if isinstance(pdf_bytes, str):
-        return pdf_bytes.encode("latin-1")
-    return bytes(pdf_bytes)
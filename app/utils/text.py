@@ -0,0 +1,5 @@
+_SLUG_TRANS = str.maketrans({" ": "-"})
+
+
+def slugify(value):
+    return value.strip().translate(_SLUG_TRANS).lower()